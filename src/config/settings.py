@@ -8,20 +8,43 @@ Minimal env-based migration:
 - Keep other settings as internal defaults (no new envs introduced).
 - Implement load_from_file/save_to_file for simple .env-style files
   without requiring python-dotenv (docker-compose will load .env).
+- load_from_file also accepts .toml and .yaml/.yml files when a parser
+  is available; keys are flattened to upper-case env names.
 """
 
 import os
+import re
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Set, Tuple
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
 
 
-def _get_env_str(name: str, default: str) -> str:
-    val = os.getenv(name)
+# [export ]KEY=VALUE lines of a .env file; surrounding whitespace is not part of key or value
+_ENV_LINE_RE = re.compile(
+    r"^[ \t]*(?:export[ \t]+)?([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t\r]*$", re.MULTILINE
+)
+
+
+def _get_env_str(env: Mapping[str, str], name: str, default: str) -> str:
+    val = env.get(name)
     return default if val is None else val
 
 
-def _get_env_int(name: str, default: int) -> int:
-    val = os.getenv(name)
+def _get_env_int(env: Mapping[str, str], name: str, default: int) -> int:
+    val = env.get(name)
     if val is None or val == "":
         return default
     try:
@@ -30,15 +53,20 @@ def _get_env_int(name: str, default: int) -> int:
         return default
 
 
-def _get_env_bool(name: str, default: bool) -> bool:
-    val = os.getenv(name)
+# Truthy env spellings: exact common forms first, then the normalized fallback
+_TRUE_VALUES = frozenset(("1", "true", "yes", "on"))
+_TRUE_SET = _TRUE_VALUES | frozenset(("TRUE", "YES", "ON", "True", "Yes", "On"))
+
+
+def _get_env_bool(env: Mapping[str, str], name: str, default: bool) -> bool:
+    val = env.get(name)
     if val is None:
         return default
-    return str(val).strip().lower() in ("1", "true", "yes", "on")
+    return val in _TRUE_SET or val.strip().lower() in _TRUE_VALUES
 
 
-def _get_env_float(name: str, default: float) -> float:
-    val = os.getenv(name)
+def _get_env_float(env: Mapping[str, str], name: str, default: float) -> float:
+    val = env.get(name)
     if val is None or val == "":
         return default
     try:
@@ -47,89 +75,204 @@ def _get_env_float(name: str, default: float) -> float:
         return default
 
 
+def _get_env_rotate(env: Mapping[str, str], name: str, default: Optional[int]) -> Optional[int]:
+    # Rotation can be None ("none", "null" or empty) or an int
+    val = env.get(name)
+    if val is None or val.strip().lower() in ("none", "null", ""):
+        return default
+    try:
+        return int(val)
+    except ValueError:
+        return default
+
+
+def _get_env_list(env: Mapping[str, str], name: str, default: Tuple[str, ...]) -> Tuple[str, ...]:
+    # Comma-separated list; an empty value means an empty list
+    val = env.get(name)
+    if val is None:
+        return default
+    return tuple(item.strip() for item in val.split(",") if item.strip())
+
+
+def _flatten_config(data: Mapping[str, Any], prefix: str = "") -> Dict[str, str]:
+    """Flatten a nested TOML/YAML mapping into upper-case env-style KEY -> str."""
+    flat: Dict[str, str] = {}
+    for key, value in data.items():
+        name = f"{prefix}{key}".upper()
+        if isinstance(value, Mapping):
+            flat.update(_flatten_config(value, name + "_"))
+        elif value is None:
+            continue
+        elif isinstance(value, bool):
+            flat[name] = "true" if value else "false"
+        elif isinstance(value, (list, tuple)):
+            flat[name] = ",".join(str(item) for item in value)
+        else:
+            flat[name] = str(value)
+    return flat
+
+
+def _flatten_config_file(data: Any, path: Path) -> Dict[str, str]:
+    """Flatten a parsed TOML/YAML document, which must be a mapping at the top level."""
+    if not isinstance(data, Mapping):
+        raise ValueError(f"Config file must contain a mapping: {path}")
+    return _flatten_config(data)
+
+
+# Repository paths, resolved once at import
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+_TEMP_DIR = _PROJECT_ROOT / "temp"
+
+# Directories already confirmed writable in this process
+_VERIFIED_DIRS: Set[Path] = set()
+
+# Layout of the .env file written by Settings.save_to_file
+_ENV_TEMPLATE = """\
+# Pi Home Dashboard Environment Configuration
+# Generated by Settings.save_to_file
+
+# Dashboard Configuration
+DAKBOARD_URL={dakboard_url}
+DEBUG={debug}
+DASHBOARD_TYPE={dashboard_type}
+
+# Update Cadence
+UPDATE_INTERVAL={update_interval}
+
+# Display Geometry
+DISPLAY_WIDTH={display_width}
+DISPLAY_HEIGHT={display_height}
+
+# Other environment variables like DISPLAY are typically set by the runtime (e.g., docker-compose).
+"""
+
+
+# Env var name -> (Settings attribute, getter) for settings that are actually used by the code
+_ENV_HANDLERS: Dict[str, Tuple[str, Callable[[Mapping[str, str], str, Any], Any]]] = {
+    # Dashboard routing
+    "DASHBOARD_TYPE": ("dashboard_type", _get_env_str),
+    "DAKBOARD_URL": ("dakboard_url", _get_env_str),
+
+    # Logging/debug
+    "DEBUG": ("debug_mode", _get_env_bool),
+
+    # Update cadence
+    "UPDATE_INTERVAL": ("update_interval", _get_env_int),
+    "BROWSER_TIMEOUT": ("browser_timeout", _get_env_int),
+    "READY_SELECTOR": ("ready_selector", _get_env_str),
+    "READY_PREDICATE": ("ready_predicate", _get_env_str),
+    "RENDER_SETTLE_MS": ("render_settle_ms", _get_env_int),
+    "SCREENSHOT_JPEG_QUALITY": ("screenshot_jpeg_quality", _get_env_int),
+    "LOW_MEMORY": ("low_memory", _get_env_bool),
+    "BROWSER_IMAGES_ENABLED": ("browser_images_enabled", _get_env_bool),
+    "MAX_BROWSER_MEMORY_MB": ("max_browser_memory_mb", _get_env_int),
+    "BLOCKED_URL_PATTERNS": ("blocked_url_patterns", _get_env_list),
+
+    # E-ink display settings
+    "FULL_UPDATE_INTERVAL": ("full_update_interval", _get_env_int),
+
+    # Display geometry
+    "DISPLAY_WIDTH": ("display_width", _get_env_int),
+    "DISPLAY_HEIGHT": ("display_height", _get_env_int),
+
+    # Display driver type
+    "DISPLAY_TYPE": ("display_type", _get_env_str),
+
+    # IT8951 specific settings
+    "IT8951_VCOM": ("it8951_vcom", _get_env_float),
+    "IT8951_SPI_HZ": ("it8951_spi_hz", _get_env_int),
+    "IT8951_MIRROR": ("it8951_mirror", _get_env_bool),
+    "IT8951_ROTATE": ("it8951_rotate", _get_env_rotate),
+}
+
+
+# Centralized defaults (used-only envs will override these)
+_RAW_DEFAULTS = {
+    # Display settings
+    "display_width": 400,
+    "display_height": 200,
+    "display_rotation": 0,  # 0, 90, 180, 270 degrees
+
+    # Update intervals (in seconds)
+    "update_interval": 60,           # 1 minute
+
+    # Dashboard settings
+    "dashboard_type": "dakboard",    # "dakboard" or "custom" or "integration_test"
+    "dakboard_url": "",
+
+    # System settings
+    "debug_mode": False,
+    "log_level": "INFO",
+    "log_file": "/var/log/pi-dashboard.log",
+
+    # Browser settings for rendering
+    "browser_timeout": 30,  # seconds
+    "ready_selector": "body",  # element that must be visible before a page counts as loaded
+    # JS expression; pages that define window.__dashReady are waited on until it is true
+    "ready_predicate": (
+        "typeof window.__dashReady === 'undefined'"
+        " ? document.readyState === 'complete' : window.__dashReady === true"
+    ),
+    "render_settle_ms": 0,     # extra settle time after the page is ready
+    "screenshot_jpeg_quality": 95,  # JPEG quality for grayscale-mode screenshots (bw mode uses PNG)
+    "low_memory": True,        # run Chromium as a single process
+    "browser_images_enabled": True,  # False skips image loading: less memory, but DAKboard photos go blank
+    "max_browser_memory_mb": 350,  # restart the browser when its PSS stays above this; 0 disables
+    # URL patterns (CDP wildcard syntax) the browser never fetches: media and analytics.
+    # Web fonts are kept since they change text layout on the dashboard.
+    "blocked_url_patterns": (
+        "*.mp4", "*.webm", "*.ogg", "*.mp3", "*.wav",
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    ),
+
+    # E-ink display specific settings
+    "full_update_interval": 3600,    # 1 hour
+    "eink_ghosting_prevention": True,
+
+    # Display driver settings
+    "display_type": "it8951",  # "it8951" for hardware, "mock" for testing
+    "epd_mode": "bw",  # Display mode: "bw" or "gray16"
+    
+    # IT8951 specific settings
+    "it8951_vcom": -1.46,      # VCOM voltage for IT8951 display (-1.5V to -3.0V range)
+    "it8951_spi_hz": 16000000, # SPI frequency in Hz (16MHz for balanced performance/stability)
+    "it8951_mirror": True,     # Mirror display output to fix reversed images
+    "it8951_rotate": None,     # Rotation: None, 90, 180, 270
+
+    # Prometheus metrics settings
+    "prometheus_port": 8000,
+    "prometheus_enabled": True,
+}
+_DEFAULT_ITEMS: Tuple[Tuple[str, Any], ...] = tuple(_RAW_DEFAULTS.items())
+
+
 class Settings:
     """Main configuration class for the dashboard."""
 
-    # Centralized defaults (used-only envs will override these)
-    DEFAULTS = {
-        # Display settings
-        "display_width": 400,
-        "display_height": 200,
-        "display_rotation": 0,  # 0, 90, 180, 270 degrees
-
-        # Update intervals (in seconds)
-        "update_interval": 60,           # 1 minute
-
-        # Dashboard settings
-        "dashboard_type": "dakboard",    # "dakboard" or "custom" or "integration_test"
-        "dakboard_url": "",
-
-        # System settings
-        "debug_mode": False,
-        "log_level": "INFO",
-        "log_file": "/var/log/pi-dashboard.log",
-
-        # Browser settings for rendering
-        "browser_timeout": 30,  # seconds
-
-        # E-ink display specific settings
-        "full_update_interval": 3600,    # 1 hour
-        "eink_ghosting_prevention": True,
-
-        # Display driver settings
-        "display_type": "it8951",  # "it8951" for hardware, "mock" for testing
-        "epd_mode": "bw",  # Display mode: "bw" or "gray16"
-        
-        # IT8951 specific settings
-        "it8951_vcom": -1.46,      # VCOM voltage for IT8951 display (-1.5V to -3.0V range)
-        "it8951_spi_hz": 16000000, # SPI frequency in Hz (16MHz for balanced performance/stability)
-        "it8951_mirror": True,     # Mirror display output to fix reversed images
-        "it8951_rotate": None,     # Rotation: None, 90, 180, 270
-
-        # Prometheus metrics settings
-        "prometheus_port": 8000,
-        "prometheus_enabled": True,
-    }
+    # Centralized defaults (used-only envs will override these); read-only view
+    DEFAULTS: Mapping[str, Any] = MappingProxyType(_RAW_DEFAULTS)
+
+    # Fixed attribute layout: every default plus the derived settings set in __init__
+    __slots__ = tuple(_RAW_DEFAULTS) + (
+        "project_root",
+        "temp_dir",
+        "browser_width",
+        "browser_height",
+        "test_html_path",
+    )
 
     def __init__(self):
         """Initialize settings with defaults, then apply env overrides where used."""
         # Paths
-        self.project_root = Path(__file__).resolve().parents[2]
-        self.temp_dir = self.project_root / "temp"
+        self.project_root = _PROJECT_ROOT
+        self.temp_dir = _TEMP_DIR
 
         # Initialize with defaults
-        self.display_width = self.DEFAULTS["display_width"]
-        self.display_height = self.DEFAULTS["display_height"]
-        self.display_rotation = self.DEFAULTS["display_rotation"]
-
-        self.update_interval = self.DEFAULTS["update_interval"]
-
-        self.dashboard_type = self.DEFAULTS["dashboard_type"]
-        self.dakboard_url = self.DEFAULTS["dakboard_url"]
-
-        self.debug_mode = self.DEFAULTS["debug_mode"]
-        self.log_level = self.DEFAULTS["log_level"]
-        self.log_file = self.DEFAULTS["log_file"]
+        for name, value in _DEFAULT_ITEMS:
+            setattr(self, name, value)
 
         self.browser_width = self.display_width
         self.browser_height = self.display_height
-        self.browser_timeout = self.DEFAULTS["browser_timeout"]
-
-        self.full_update_interval = self.DEFAULTS["full_update_interval"]
-        self.eink_ghosting_prevention = self.DEFAULTS["eink_ghosting_prevention"]
-
-        self.display_type = self.DEFAULTS["display_type"]
-        self.epd_mode = self.DEFAULTS["epd_mode"]
-
-        # IT8951 specific settings
-        self.it8951_vcom = self.DEFAULTS["it8951_vcom"]
-        self.it8951_spi_hz = self.DEFAULTS["it8951_spi_hz"]
-        self.it8951_mirror = self.DEFAULTS["it8951_mirror"]
-        self.it8951_rotate = self.DEFAULTS["it8951_rotate"]
-
-        # Prometheus metrics settings
-        self.prometheus_port = self.DEFAULTS["prometheus_port"]
-        self.prometheus_enabled = self.DEFAULTS["prometheus_enabled"]
 
         # Integration test settings
         self.test_html_path: Optional[Path] = None  # Path to test HTML file for integration tests
@@ -144,54 +287,40 @@ class Settings:
         self.browser_width = self.display_width
         self.browser_height = self.display_height
 
-    def _apply_env_overrides(self):
-        """Apply environment variable overrides for used-only settings."""
-        # Dashboard routing
-        self.dashboard_type = _get_env_str("DASHBOARD_TYPE", self.dashboard_type)
-        # Dakboard URL (already env-aware originally)
-        self.dakboard_url = _get_env_str("DAKBOARD_URL", self.dakboard_url)
-
-        # Logging/debug
-        self.debug_mode = _get_env_bool("DEBUG", self.debug_mode)
-
-        # Update cadence
-        self.update_interval = _get_env_int("UPDATE_INTERVAL", self.update_interval)
-        self.browser_timeout = _get_env_int("BROWSER_TIMEOUT", self.browser_timeout)
-
-        # E-ink display settings
-        self.full_update_interval = _get_env_int("FULL_UPDATE_INTERVAL", self.full_update_interval)
-
-        # Display geometry
-        self.display_width = _get_env_int("DISPLAY_WIDTH", self.display_width)
-        self.display_height = _get_env_int("DISPLAY_HEIGHT", self.display_height)
-
-        # Display driver type
-        self.display_type = _get_env_str("DISPLAY_TYPE", self.display_type)
-
-        # IT8951 specific settings
-        self.it8951_vcom = _get_env_float("IT8951_VCOM", self.it8951_vcom)
-        self.it8951_spi_hz = _get_env_int("IT8951_SPI_HZ", self.it8951_spi_hz)
-        self.it8951_mirror = _get_env_bool("IT8951_MIRROR", self.it8951_mirror)
-        
-        # Handle IT8951_ROTATE which can be None or int
-        rotate_env = os.getenv("IT8951_ROTATE")
-        if rotate_env is not None and rotate_env.strip().lower() not in ("none", "null", ""):
-            try:
-                self.it8951_rotate = int(rotate_env)
-            except ValueError:
-                pass  # Keep default value
+    def _apply_env_overrides(self, names: Optional[Iterable[str]] = None):
+        """Apply environment variable overrides for used-only settings.
+
+        Args:
+            names: Optional subset of env var names to re-read. Defaults to all
+                   names in _ENV_HANDLERS.
+        """
+        # Read os.environ directly; copying it would decode every variable, not just ours
+        env = os.environ
+
+        for name in (_ENV_HANDLERS if names is None else names):
+            handler = _ENV_HANDLERS.get(name)
+            if handler is None:
+                continue
+            attr, getter = handler
+            setattr(self, attr, getter(env, name, getattr(self, attr)))
 
     def _ensure_directory_writable(self, directory: Path):
         """Ensure directory exists and is writable by current user."""
+        # Already verified by an earlier Settings instance in this process
+        if directory in _VERIFIED_DIRS:
+            return
+
         try:
-            # Create directory if it doesn't exist
-            directory.mkdir(exist_ok=True, parents=True)
-            
-            # Test if we can write to the directory
+            # Test if we can write to the directory, creating it only if it doesn't exist
             test_file = directory / ".write_test"
             try:
-                test_file.touch()
+                try:
+                    test_file.touch()
+                except FileNotFoundError:
+                    directory.mkdir(exist_ok=True, parents=True)
+                    test_file.touch()
                 test_file.unlink()
+                _VERIFIED_DIRS.add(directory)
             except (PermissionError, OSError):
                 # If we can't write, try to fix permissions if possible
                 import stat
@@ -209,78 +338,99 @@ class Settings:
             logger = logging.getLogger(__name__)
             logger.warning(f"Could not ensure directory {directory} is writable: {e}")
 
-    def validate(self):
-        """Validate configuration settings."""
-        errors = []
-
-        if self.dashboard_type == "dakboard" and not self.dakboard_url:
-            errors.append("DAKboard URL is required when using DAKboard dashboard type")
-
-        if self.display_width <= 0 or self.display_height <= 0:
-            errors.append("Display dimensions must be positive integers")
-
-        if self.display_rotation not in (0, 90, 180, 270):
-            errors.append("Display rotation must be one of: 0, 90, 180, 270")
+    # (predicate, error message) pairs; a predicate returns True when the settings are valid
+    _VALIDATORS: Tuple[Tuple[Callable[["Settings"], bool], str], ...] = (
+        (lambda s: s.dashboard_type != "dakboard" or bool(s.dakboard_url),
+         "DAKboard URL is required when using DAKboard dashboard type"),
+        (lambda s: s.display_width > 0 and s.display_height > 0,
+         "Display dimensions must be positive integers"),
+        (lambda s: s.display_rotation in (0, 90, 180, 270),
+         "Display rotation must be one of: 0, 90, 180, 270"),
+        (lambda s: s.browser_timeout > 0,
+         "Browser timeout must be positive"),
+    )
+
+    def is_valid(self) -> bool:
+        """Return whether all settings are valid, stopping at the first failed check."""
+        for check, _ in self._VALIDATORS:
+            if not check(self):
+                return False
+        return True
 
-        if self.browser_timeout <= 0:
-            errors.append("Browser timeout must be positive")
+    def validate(self):
+        """Validate configuration settings, reporting every failed check."""
+        errors = [message for check, message in self._VALIDATORS if not check(self)]
 
         if errors:
             raise ValueError("Configuration validation failed:\n" + "\n".join(errors))
 
         return True
 
-    def load_from_file(self, config_file: Path):
-        """Load settings from a simple .env-style file and apply to environment.
+    def load_from_file(self, config_file: Path, override: bool = True):
+        """Load settings from a config file and apply to environment.
 
         Notes:
         - This does not require python-dotenv.
-        - Lines starting with '#' are comments.
-        - Only keys without quotes and simple 'KEY=VALUE' are supported.
-        - After loading, environment variables for used-only settings are applied.
+        - .toml files need tomllib (Python 3.11+) or tomli; .yaml/.yml files need PyYAML.
+          Nested tables are flattened, e.g. [display] width -> DISPLAY_WIDTH.
+        - Any other suffix is parsed as .env: lines starting with '#' are comments,
+          and only keys without quotes and simple 'KEY=VALUE' (optionally prefixed
+          with 'export ') are supported.
+        - With override=False, variables already present in the environment win
+          over the file (docker-compose / shell values are kept).
+        - After loading, overrides are re-applied only for the keys the file set.
         """
         cfg_path = Path(config_file)
         if not cfg_path.exists():
             raise FileNotFoundError(f"Config file not found: {cfg_path}")
 
-        with cfg_path.open("r", encoding="utf-8") as f:
-            for raw in f:
-                line = raw.strip()
-                if not line or line.startswith("#"):
-                    continue
-                if "=" not in line:
-                    continue
-                key, value = line.split("=", 1)
-                key = key.strip()
-                value = value.strip()
+        suffix = cfg_path.suffix.lower()
+        if suffix == ".toml":
+            if tomllib is None:
+                raise RuntimeError("TOML config requires Python 3.11+ or the 'tomli' package")
+            parsed = _flatten_config_file(tomllib.loads(cfg_path.read_text(encoding="utf-8")), cfg_path)
+        elif suffix in (".yaml", ".yml"):
+            if yaml is None:
+                raise RuntimeError("YAML config requires the 'PyYAML' package")
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            data = yaml.load(cfg_path.read_text(encoding="utf-8"), Loader=loader)
+            parsed = _flatten_config_file({} if data is None else data, cfg_path)  # None: empty file
+        else:
+            # Bulk-read bytes; a stray invalid byte should not abort the whole load
+            text = cfg_path.read_bytes().decode("utf-8", "replace")
+
+            # Comment lines never match the key pattern, so they are skipped implicitly
+            parsed = {}
+            for match in _ENV_LINE_RE.finditer(text):
+                key, value = match.group(1), match.group(2)
                 # Remove optional surrounding quotes
-                if (value.startswith('"') and value.endswith('"')) or (value.startswith("'") and value.endswith("'")):
+                first = value[:1]
+                if first in ('"', "'") and value[-1:] == first:
                     value = value[1:-1]
-                os.environ[key] = value
+                parsed[key] = value
 
-        # Re-apply env overrides
-        self._apply_env_overrides()
+        if not override:
+            parsed = {key: value for key, value in parsed.items() if key not in os.environ}
+        os.environ.update(parsed)
+
+        # Re-apply env overrides for the keys the file actually set
+        self._apply_env_overrides(parsed)
+
+        # Keep browser size in sync with display
+        self.browser_width = self.display_width
+        self.browser_height = self.display_height
 
     def save_to_file(self, config_file: Path):
         """Save current used-only settings to a .env-style configuration file."""
         cfg_path = Path(config_file)
-        lines = [
-            "# Pi Home Dashboard Environment Configuration",
-            "# Generated by Settings.save_to_file",
-            "",
-            "# Dashboard Configuration",
-            f"DAKBOARD_URL={self.dakboard_url}",
-            f"DEBUG={'true' if self.debug_mode else 'false'}",
-            f"DASHBOARD_TYPE={self.dashboard_type}",
-            "",
-            "# Update Cadence",
-            f"UPDATE_INTERVAL={self.update_interval}",
-            "",
-            "# Display Geometry",
-            f"DISPLAY_WIDTH={self.display_width}",
-            f"DISPLAY_HEIGHT={self.display_height}",
-            "",
-            "# Other environment variables like DISPLAY are typically set by the runtime (e.g., docker-compose).",
-        ]
-        cfg_path.parent.mkdir(parents=True, exist_ok=True)
-        cfg_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        text = _ENV_TEMPLATE.format(
+            dakboard_url=self.dakboard_url,
+            debug="true" if self.debug_mode else "false",
+            dashboard_type=self.dashboard_type,
+            update_interval=self.update_interval,
+            display_width=self.display_width,
+            display_height=self.display_height,
+        )
+        if cfg_path.parent not in _VERIFIED_DIRS:
+            cfg_path.parent.mkdir(parents=True, exist_ok=True)
+        cfg_path.write_text(text, encoding="utf-8")
@@ -4,12 +4,37 @@ Uses the existing test_dashboard.html file when dashboard_type='mock'.
 """
 
 import logging
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 from PIL import Image
 
 from .renderer import DashboardRenderer
 
+# Bundled test dashboard, resolved once at import
+_TEST_HTML_PATH = Path(__file__).resolve().parent.parent / "test" / "test_dashboard.html"
+_TEST_HTML_EXISTS = _TEST_HTML_PATH.is_file()
+_TEST_HTML_URL = f"file://{_TEST_HTML_PATH}"
+
+_MISSING = object()
+
+
+@contextmanager
+def _swap_settings(settings, **overrides):
+    """Temporarily set attributes on settings, restoring (or removing) them on exit."""
+    saved = {name: getattr(settings, name, _MISSING) for name in overrides}
+    try:
+        for name, value in overrides.items():
+            setattr(settings, name, value)
+        yield settings
+    finally:
+        for name, value in saved.items():
+            if value is _MISSING:
+                delattr(settings, name)
+            else:
+                setattr(settings, name, value)
+
 
 class MockDashboardRenderer(DashboardRenderer):
     """Mock renderer that uses test_dashboard.html instead of DAKboard."""
@@ -21,18 +46,26 @@ class MockDashboardRenderer(DashboardRenderer):
         
         # Mock mode detection
         self.mock_mode = settings.dashboard_type == 'mock'
+        self.test_html_path = None
         
         if self.mock_mode:
             # Override the dashboard URL to use local test file
-            self.test_html_path = Path(__file__).parent.parent / "test" / "test_dashboard.html"
-            if self.test_html_path.exists():
-                self.dashboard_url = f"file://{self.test_html_path.absolute()}"
+            self.test_html_path = _TEST_HTML_PATH
+            if _TEST_HTML_EXISTS:
+                self.dashboard_url = _TEST_HTML_URL
                 self.logger.info(f"Mock mode enabled - using test dashboard: {self.dashboard_url}")
             else:
                 self.logger.error(f"Test dashboard file not found: {self.test_html_path}")
                 self.mock_mode = False
         else:
             self.logger.debug("Mock dashboard renderer available but not active")
+        
+        # Stats never change after construction; build the read-only view once
+        self._mock_stats = MappingProxyType({
+            'mock_mode': self.mock_mode,
+            'test_html_path': str(self.test_html_path) if self.test_html_path is not None else None,
+            'dashboard_url': getattr(self, 'dashboard_url', None)
+        })
     
     def render(self) -> Optional[Image.Image]:
         """
@@ -48,22 +81,11 @@ class MockDashboardRenderer(DashboardRenderer):
         try:
             self.logger.info("Rendering mock dashboard from test HTML")
             
-            # Temporarily change dashboard type to integration_test and set test HTML path
-            original_dashboard_type = self.settings.dashboard_type
-            original_test_html_path = getattr(self.settings, 'test_html_path', None)
-            
-            self.settings.dashboard_type = 'integration_test'
-            self.settings.test_html_path = self.test_html_path
-            
-            # Render using the parent class integration_test method
-            result = super().render()
-            
-            # Restore original settings
-            self.settings.dashboard_type = original_dashboard_type
-            if original_test_html_path is not None:
-                self.settings.test_html_path = original_test_html_path
-            elif hasattr(self.settings, 'test_html_path'):
-                delattr(self.settings, 'test_html_path')
+            # Temporarily switch to integration_test with the test HTML path;
+            # render using the parent class integration_test method
+            with _swap_settings(self.settings, dashboard_type='integration_test',
+                                test_html_path=self.test_html_path):
+                result = super().render()
             
             if result:
                 self.logger.info("Mock dashboard rendered successfully")
@@ -80,10 +102,6 @@ class MockDashboardRenderer(DashboardRenderer):
         """Check if mock mode is active."""
         return self.mock_mode
     
-    def get_mock_stats(self) -> dict:
-        """Get mock renderer statistics."""
-        return {
-            'mock_mode': self.mock_mode,
-            'test_html_path': str(self.test_html_path) if hasattr(self, 'test_html_path') else None,
-            'dashboard_url': getattr(self, 'dashboard_url', None)
-        }
+    def get_mock_stats(self) -> Mapping[str, Any]:
+        """Get mock renderer statistics (read-only)."""
+        return self._mock_stats
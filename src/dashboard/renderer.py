@@ -4,8 +4,13 @@ Handles rendering of dashboard content using headless browser or custom layouts.
 """
 
 import asyncio
+import base64
+import concurrent.futures
+import hashlib
+import io
+import json
 import logging
-import tempfile
+import threading
 import time
 from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont
@@ -17,6 +22,96 @@ from playwright.async_api import async_playwright, BrowserContext, Page
 # Import time validator
 from monitoring.time_validator import TimeValidator
 
+# Optimized Chrome arguments for Pi Zero 2 W - Memory optimized
+CHROME_ARGS = (
+    '--headless=new',
+    '--disable-gpu',
+    '--no-sandbox',
+    '--disable-dev-shm-usage',  # Critical for Pi Zero 2 W
+    '--disable-extensions',
+    '--disable-plugins',
+    '--disable-background-networking',
+    '--disable-renderer-backgrounding',
+    '--disable-background-timer-throttling',
+    # Single --disable-features list: Chromium only honors the last occurrence of the flag.
+    # VizDisplayCompositor saves memory; IsolateOrigins/site-per-process keep the one
+    # dashboard origin in a single renderer.
+    '--disable-features=Translate,BackForwardCache,AcceptCHFrame,MediaRouter,OptimizationHints,PaintHolding,'
+    'VizDisplayCompositor,IsolateOrigins,site-per-process',
+    '--disable-site-isolation-trials',
+    '--enable-features=NetworkServiceInProcess,StorageServiceInProcess,AudioServiceInProcess',
+    '--hide-scrollbars',
+    '--mute-audio',
+    '--no-first-run',
+    '--no-default-browser-check',
+    '--disable-software-rasterizer',
+    '--disk-cache-size=0',
+    '--js-flags=--jitless --optimize_for_size',  # Interpreter-only V8: no JIT code pages, avoids Bus errors on Pi
+    '--in-process-gpu',
+    '--disable-zero-copy',
+    '--disable-gpu-memory-buffer-compositor-resources',
+    '--renderer-process-limit=1',
+    '--force-device-scale-factor=1',  # Backing store matches the e-ink resolution
+    
+    # Memory optimization flags from ChatGPT recommendations
+    '--disable-blink-features=BackForwardCache',  # Disable BFCache for memory savings
+    '--disable-ipc-flooding-protection',  # Reduce IPC overhead in single-process mode
+    '--disable-renderer-accessibility',  # Disable accessibility features
+    '--disable-speech-api',  # Disable speech synthesis
+    '--disable-web-security',  # Reduce security overhead (safe for dashboard use)
+    '--force-color-profile=srgb',  # Use simple color profile
+    '--disable-background-media-suspend',  # Prevent media suspension overhead
+)
+
+# Added when settings.low_memory is enabled
+LOW_MEMORY_CHROME_ARGS = (
+    '--single-process',  # Reduces process overhead (45-90MB vs 110-180MB)
+    '--no-zygote',
+)
+
+# Added when settings.browser_images_enabled is off; saves memory but blanks photo-heavy dashboards
+NO_IMAGES_CHROME_ARGS = (
+    '--blink-settings=imagesEnabled=false',
+)
+
+# E-ink page tweaks. Rules target only the elements that animate or play media, rather
+# than a universal selector every element would be matched against on each style recalc;
+# general animation is suppressed through prefers-reduced-motion on the context.
+EINK_CSS = """
+html, body {
+    zoom: 1 !important;
+    scroll-behavior: auto !important;
+}
+video, audio, iframe[src*="video"] {
+    display: none !important;
+}
+.slideshow, .carousel, [class*="animate"] {
+    animation: none !important;
+    transition: none !important;
+}
+"""
+
+# Injects EINK_CSS into every document the context loads. Init scripts run as soon as
+# the root element exists, before any page content is parsed, so the style is attached
+# right away rather than on DOMContentLoaded, which Chromium may paint before.
+EINK_INIT_SCRIPT = f"""
+(() => {{
+    const style = document.createElement('style');
+    style.textContent = {json.dumps(EINK_CSS)};
+    (document.head || document.documentElement).appendChild(style);
+}})();
+"""
+
+# True once the document, its images and its web fonts have all finished loading
+PAGE_SETTLED_JS = (
+    "document.readyState === 'complete'"
+    " && Array.from(document.images).every(img => img.complete)"
+    " && (!document.fonts || document.fonts.status === 'loaded')"
+)
+
+# Upper bound on a single browser call; longer than the 3 minute navigation timeout
+BROWSER_CALL_TIMEOUT = 240
+
 
 class DashboardRenderer:
     """Main dashboard rendering class."""
@@ -33,47 +128,36 @@ class DashboardRenderer:
         self.playwright = None
         self.context = None
         self.page = None
+        self.cdp_session = None
         self.is_persistent_browser_running = False
         self.current_url = None
+        
+        # Last capture and the DOM hash it was taken from, for skipping unchanged pages
+        self._last_page_hash = None
+        self._last_screenshot_bytes = None
         self.loop = None
+        self.loop_thread = None
         
         # Browser configuration
         self.user_data_dir = Path(settings.project_root) / ".cache" / "chromium_profile"
         self.user_data_dir.mkdir(parents=True, exist_ok=True)
         
-        # Optimized Chrome arguments for Pi Zero 2 W - Memory optimized
-        self.chrome_args = [
-            '--headless=new',
-            '--disable-gpu',
-            '--no-sandbox',
-            '--disable-dev-shm-usage',  # Critical for Pi Zero 2 W
-            '--disable-extensions',
-            '--disable-plugins',
-            '--disable-background-networking',
-            '--disable-renderer-backgrounding',
-            '--disable-background-timer-throttling',
-            '--disable-features=Translate,BackForwardCache,AcceptCHFrame,MediaRouter,OptimizationHints,PaintHolding',
-            '--hide-scrollbars',
-            '--mute-audio',
-            '--no-first-run',
-            '--no-default-browser-check',
-            '--disable-software-rasterizer',
-            '--disk-cache-size=0',
-            '--memory-pressure-off',
-            '--max_old_space_size=256',  # Limit V8 heap for Pi
-            
-            # Memory optimization flags from ChatGPT recommendations
-            '--single-process',  # Reduces process overhead (45-90MB vs 110-180MB)
-            '--blink-settings=imagesEnabled=false',  # Biggest memory saver - disables image loading
-            '--disable-blink-features=BackForwardCache',  # Disable BFCache for memory savings
-            '--disable-ipc-flooding-protection',  # Reduce IPC overhead in single-process mode
-            '--disable-renderer-accessibility',  # Disable accessibility features
-            '--disable-speech-api',  # Disable speech synthesis
-            '--disable-web-security',  # Reduce security overhead (safe for dashboard use)
-            '--disable-features=VizDisplayCompositor',  # Disable compositor for memory savings
-            '--force-color-profile=srgb',  # Use simple color profile
-            '--disable-background-media-suspend',  # Prevent media suspension overhead
-        ]
+        # Integration test file: cached (path, file URL) and last loaded (file URL, mtime)
+        self._test_html_url = None
+        self._test_html_loaded = None
+        
+        # Timestamp overlay font and prerendered box, built on first use
+        self._overlay_font = None
+        self._overlay_strip = None
+        self._overlay_strip_xy = None
+        self._overlay_text_xy = None
+        self._overlay_key = None
+        
+        self.chrome_args = list(CHROME_ARGS)
+        if settings.low_memory:
+            self.chrome_args.extend(LOW_MEMORY_CHROME_ARGS)
+        if not settings.browser_images_enabled:
+            self.chrome_args.extend(NO_IMAGES_CHROME_ARGS)
         
     def render(self):
         """Render the dashboard and return a PIL Image."""
@@ -104,51 +188,74 @@ class DashboardRenderer:
             self.logger.error("DAKboard URL not configured")
             return None
 
-        self.logger.info(f"Rendering DAKboard from URL: {self.settings.dakboard_url}")
+        self.logger.debug(f"Rendering DAKboard from URL: {self.settings.dakboard_url}")
         
-        # Start persistent browser if not running
-        if not self.is_persistent_browser_running:
-            if not self.start_persistent_browser(self.settings.dakboard_url):
-                self.logger.error("Failed to start persistent browser")
-                return None
+        # Start persistent browser if not running, or point it at the DAKboard URL
+        if not self._ensure_persistent_page(self.settings.dakboard_url):
+            return None
         
         # Take screenshot using persistent browser
         return self.render_persistent_screenshot()
     
     def _render_integration_test(self):
         """Render integration test dashboard using persistent browser."""
-        self.logger.info("Rendering integration test dashboard")
+        self.logger.debug("Rendering integration test dashboard")
 
-        if not hasattr(self.settings, 'test_html_path') or self.settings.test_html_path is None:
+        if self.settings.test_html_path is None:
             self.logger.error("Integration test HTML path not configured")
             return None
 
-        if not self.settings.test_html_path.exists():
-            self.logger.error(f"Integration test HTML file not found: {self.settings.test_html_path}")
+        test_html_path = self.settings.test_html_path
+        try:
+            mtime = test_html_path.stat().st_mtime
+        except OSError:
+            self.logger.error(f"Integration test HTML file not found: {test_html_path}")
             return None
 
-        file_url = f"file://{self.settings.test_html_path.absolute()}"
-        self.logger.info(f"Rendering integration test from: {file_url}")
+        # file:// URL is cached per path
+        if self._test_html_url is None or self._test_html_url[0] != test_html_path:
+            self._test_html_url = (test_html_path, f"file://{test_html_path.absolute()}")
+        file_url = self._test_html_url[1]
+        self.logger.debug(f"Rendering integration test from: {file_url}")
 
-        # Start persistent browser if not running
-        if not self.is_persistent_browser_running:
-            if not self.start_persistent_browser(file_url):
-                self.logger.error("Failed to start persistent browser")
-                return None
+        # Start persistent browser if not running, or point it at the test file
+        previous_load = self._test_html_loaded
+        if not self._ensure_persistent_page(file_url):
+            return None
+
+        # The page is already showing this file; reload only if it changed on disk
+        if previous_load is not None and previous_load[0] == file_url and previous_load[1] != mtime:
+            self.logger.info("Integration test HTML changed on disk, reloading")
+            self.refresh_persistent_browser()
+        self._test_html_loaded = (file_url, mtime)
         
         # Take screenshot using persistent browser
         return self.render_persistent_screenshot()
     
+    def _ensure_persistent_page(self, url: str) -> bool:
+        """Make sure the persistent browser is running and showing url.
+        
+        A running browser is navigated to a new URL in place rather than relaunched.
+        """
+        if not self.is_persistent_browser_running:
+            if not self.start_persistent_browser(url):
+                self.logger.error("Failed to start persistent browser")
+                return False
+        elif self.current_url != url:
+            if not self.navigate_persistent_browser(url):
+                self.logger.error(f"Failed to navigate persistent browser to {url}")
+                return False
+        return True
+    
     def _render_custom(self):
         """Render custom dashboard layout."""
         try:
             self.logger.info("Rendering custom dashboard")
             
-            # Create a blank image with display dimensions
-            image = Image.new('RGB', 
-                            (self.settings.display_width, self.settings.display_height))
-            # Fill with white background
-            image.paste((255, 255, 255), (0, 0, self.settings.display_width, self.settings.display_height))
+            # Create a white image with display dimensions
+            image = Image.new('RGB',
+                              (self.settings.display_width, self.settings.display_height),
+                              (255, 255, 255))
             
             # TODO: Implement custom dashboard rendering
             # This would involve:
@@ -170,21 +277,41 @@ class DashboardRenderer:
         try:
             self.logger.info("Starting persistent browser...")
             
-            # Create event loop if needed
+            # Create the browser event loop thread if needed
             if self.loop is None:
                 self.loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(self.loop)
+                self.loop_thread = threading.Thread(
+                    target=self.loop.run_forever, name="browser-loop", daemon=True
+                )
+                self.loop_thread.start()
             
             # Start the persistent browser
-            success = self.loop.run_until_complete(self._start_persistent_browser_async(url))
+            success = self._run_async(self._start_persistent_browser_async(url))
             return success
             
         except Exception as e:
             self.logger.error(f"Failed to start persistent browser: {e}")
             return False
     
+    def _run_async(self, coro):
+        """Run a coroutine on the browser loop thread and wait for its result.
+        
+        A call that exceeds BROWSER_CALL_TIMEOUT is cancelled on the loop so it
+        cannot keep driving the page behind the next call.
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result(timeout=BROWSER_CALL_TIMEOUT)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+    
     async def _start_persistent_browser_async(self, url: str) -> bool:
         """Async method to start persistent browser."""
+        # A retry must not orphan the Chromium from an earlier, half-started attempt
+        if self.context or self.playwright:
+            await self._cleanup_persistent_browser()
+        
         try:
             # Initialize Playwright
             self.playwright = await async_playwright().start()
@@ -198,12 +325,32 @@ class DashboardRenderer:
                     "width": self.settings.browser_width,
                     "height": self.settings.browser_height
                 },
+                device_scale_factor=1,
+                is_mobile=False,
+                has_touch=False,
+                color_scheme="light",
+                reduced_motion="reduce",
                 accept_downloads=False,
                 ignore_https_errors=True,
             )
             
+            # E-ink page tweaks, applied by Chromium to every document load
+            await self.context.add_init_script(script=EINK_INIT_SCRIPT)
+            
             # Get or create page
             self.page = self.context.pages[0] if self.context.pages else await self.context.new_page()
+            self.cdp_session = await self.context.new_cdp_session(self.page)
+            
+            # Block non-essential requests. Fetch interception with only the blocked patterns
+            # pauses just the matching requests; everything else never reaches Python.
+            if self.settings.blocked_url_patterns:
+                self.cdp_session.on("Fetch.requestPaused", self._fail_blocked_request)
+                await self.cdp_session.send("Fetch.enable", {
+                    "patterns": [
+                        {"urlPattern": pattern, "requestStage": "Request"}
+                        for pattern in self.settings.blocked_url_patterns
+                    ]
+                })
             
             # Set timeouts
             self.page.set_default_navigation_timeout(180_000)  # 3 minutes
@@ -211,20 +358,15 @@ class DashboardRenderer:
             
             # Load the initial page
             self.logger.info(f"Loading initial page: {url}")
-            await self.page.goto(url, wait_until="networkidle")
+            await self.page.goto(url, wait_until="domcontentloaded")
             
             # Wait for all components to be fully loaded
             await self._wait_for_components_loaded()
             
-            # Optimize for e-ink display
-            await self._optimize_page_for_eink()
-            
-            # Take initial screenshot to verify everything works
-            test_path = self.user_data_dir / "test_screenshot.png"
-            await self.page.screenshot(path=str(test_path))
+            # Take initial screenshot in memory to verify everything works
+            test_bytes = await self.page.screenshot()
             
-            if test_path.exists():
-                test_path.unlink()  # Clean up test file
+            if test_bytes:
                 self.is_persistent_browser_running = True
                 self.current_url = url
                 self.logger.info("Persistent browser started successfully")
@@ -233,21 +375,46 @@ class DashboardRenderer:
                 self.logger.error("Failed to take initial screenshot")
                 return False
                 
+        except asyncio.CancelledError:
+            # _run_async timed out; close what was launched before the retry starts another
+            self.logger.error("Persistent browser start timed out; cleaning up")
+            await self._cleanup_persistent_browser()
+            raise
         except Exception as e:
             self.logger.error(f"Failed to start persistent browser: {e}")
             await self._cleanup_persistent_browser()
             return False
     
+    async def _fail_blocked_request(self, event):
+        """Fail a request paused by the Fetch patterns in blocked_url_patterns."""
+        try:
+            await self.cdp_session.send(
+                "Fetch.failRequest", {"requestId": event["requestId"], "errorReason": "BlockedByClient"}
+            )
+        except Exception as e:
+            # The page may have navigated or closed while the request was paused
+            self.logger.debug(f"Could not fail blocked request {event.get('request', {}).get('url')}: {e}")
+    
+    async def _wait_for_page_ready(self):
+        """Wait for the ready selector, load event and ready predicate instead of network idle.
+        
+        Dashboards like DAKboard poll continuously and may never reach network idle.
+        """
+        timeout_ms = self.settings.browser_timeout * 1000
+        await self.page.wait_for_selector(self.settings.ready_selector or "body", state="visible", timeout=timeout_ms)
+        await self.page.wait_for_load_state("load", timeout=timeout_ms)
+        if self.settings.ready_predicate:
+            await self.page.wait_for_function(self.settings.ready_predicate, timeout=timeout_ms)
+        if self.settings.render_settle_ms > 0:
+            await self.page.wait_for_timeout(self.settings.render_settle_ms)
+    
     async def _wait_for_components_loaded(self):
         """Wait for all components to be fully loaded before taking screenshot."""
         try:
-            self.logger.info("Waiting for components to load...")
+            self.logger.debug("Waiting for components to load...")
             
-            # Wait for DOM to be ready
-            await self.page.wait_for_load_state("domcontentloaded")
-            
-            # Wait for all network requests to complete
-            await self.page.wait_for_load_state("networkidle")
+            # Wait for the ready selector and load event (not network idle)
+            await self._wait_for_page_ready()
             
             # Wait for JavaScript to execute and dynamic content to load
             await asyncio.sleep(2)  # Give time for JS execution
@@ -269,48 +436,13 @@ class DashboardRenderer:
             # Additional wait for dynamic content updates
             await asyncio.sleep(1)
             
-            self.logger.info("Component loading wait completed")
+            self.logger.debug("Component loading wait completed")
             
         except Exception as e:
             self.logger.warning(f"Error waiting for components: {e}")
             # Continue anyway after a short delay
             await asyncio.sleep(2)
     
-    async def _optimize_page_for_eink(self):
-        """Optimize the page for e-ink display rendering."""
-        try:
-            if not self.page:
-                self.logger.warning("Page not available for optimization")
-                return
-                
-            # Disable animations and transitions
-            await self.page.add_style_tag(content="""
-                * { 
-                    animation: none !important; 
-                    transition: none !important; 
-                    animation-duration: 0s !important;
-                    transition-duration: 0s !important;
-                }
-                video, audio { 
-                    display: none !important; 
-                }
-                .slideshow, .carousel {
-                    animation: none !important;
-                }
-            """)
-            
-            # Ensure proper scroll position and zoom
-            await self.page.evaluate("""
-                window.scrollTo(0, 0);
-                document.body.style.zoom = '100%';
-                document.documentElement.style.zoom = '100%';
-            """)
-            
-            self.logger.debug("Page optimized for e-ink display")
-            
-        except Exception as e:
-            self.logger.warning(f"Failed to optimize page: {e}")
-    
     def render_persistent_screenshot(self) -> Optional[Image.Image]:
         """Take a screenshot using the persistent browser."""
         if not self.is_persistent_browser_running or not self.loop:
@@ -318,18 +450,12 @@ class DashboardRenderer:
             return None
         
         try:
-            # Create temporary file for screenshot
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as temp_file:
-                temp_path = Path(temp_file.name)
-            
-            # Take screenshot using async method
-            success = self.loop.run_until_complete(
-                self._take_screenshot_async(temp_path)
-            )
+            # Take screenshot using async method; bytes stay in memory
+            screenshot_bytes = self._run_async(self._take_screenshot_async())
             
-            if success and temp_path.exists():
-                image = Image.open(temp_path)
-                temp_path.unlink()  # Clean up temp file
+            if screenshot_bytes:
+                image = Image.open(io.BytesIO(screenshot_bytes))
+                image.load()  # Decode now so the buffer can be released
                 
                 # Add timestamp overlay if debug mode is enabled
                 if self.settings.debug_mode:
@@ -344,89 +470,93 @@ class DashboardRenderer:
             self.logger.error(f"Error taking persistent screenshot: {e}")
             return None
     
+    def _prepare_overlay(self, mode: str):
+        """Load the overlay font and prerender the boxed background strip for mode.
+        
+        The timestamp format always renders to the same size, so the font, the box
+        geometry and the strip only change with the display size or image mode.
+        """
+        font_size = max(12, min(24, self.settings.display_width // 80))  # Scale font with display size
+        
+        # Try to load a font, fall back to default if not available
+        try:
+            # Try to use a system font
+            font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", font_size)
+        except (OSError, IOError):
+            try:
+                # Fall back to default PIL font
+                font = ImageFont.load_default()
+            except:
+                # If all else fails, use None (PIL will use built-in font)
+                font = None
+        
+        # Calculate text dimensions for "%Y-%m-%d %H:%M:%S"
+        if font:
+            bbox = ImageDraw.Draw(Image.new('1', (1, 1))).textbbox((0, 0), "0000-00-00 00:00:00", font=font)
+            text_width = bbox[2] - bbox[0]
+            text_height = bbox[3] - bbox[1]
+        else:
+            # Estimate dimensions for default font
+            text_width = 19 * 6
+            text_height = 11
+        
+        # Calculate position for bottom right corner, never negative
+        buffer_pixels = 50
+        x = max(0, self.settings.display_width - text_width - buffer_pixels)
+        y = max(0, self.settings.display_height - text_height - buffer_pixels)
+        
+        # Solid white box with a black border (no transparency on e-ink)
+        padding = 4
+        strip = Image.new(mode, (text_width + 2 * padding + 1, text_height + 2 * padding + 1), 'white')
+        ImageDraw.Draw(strip).rectangle([0, 0, strip.width - 1, strip.height - 1], outline='black', width=1)
+        
+        self._overlay_font = font
+        self._overlay_strip = strip
+        self._overlay_strip_xy = (x - padding, y - padding)
+        self._overlay_text_xy = (x, y)
+        self._overlay_key = (self.settings.display_width, self.settings.display_height, mode)
+    
     def _add_timestamp_overlay(self, image: Image.Image) -> Image.Image:
         """Add a timestamp overlay to the bottom right corner of the image when debug mode is enabled.
         
+        The overlay is drawn in place; callers pass freshly rendered images they own.
+        
         Args:
-            image: PIL Image to add timestamp to
+            image: PIL Image to add timestamp to (modified in place)
             
         Returns:
-            PIL Image with timestamp overlay added
+            The same PIL Image with timestamp overlay added
         """
         try:
-            # Create a copy of the image to avoid modifying the original
-            img_with_overlay = image.copy()
-            draw = ImageDraw.Draw(img_with_overlay)
-            
-            # Get current timestamp
-            now = datetime.now()
-            timestamp_text = now.strftime("%Y-%m-%d %H:%M:%S")
-            
-            # Try to load a font, fall back to default if not available
-            try:
-                # Try to use a system font - adjust size based on display dimensions
-                font_size = max(12, min(24, self.settings.display_width // 80))  # Scale font with display size
-                font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", font_size)
-            except (OSError, IOError):
-                try:
-                    # Fall back to default PIL font
-                    font = ImageFont.load_default()
-                except:
-                    # If all else fails, use None (PIL will use built-in font)
-                    font = None
-            
-            # Calculate text dimensions
-            if font:
-                bbox = draw.textbbox((0, 0), timestamp_text, font=font)
-                text_width = bbox[2] - bbox[0]
-                text_height = bbox[3] - bbox[1]
-            else:
-                # Estimate dimensions for default font
-                text_width = len(timestamp_text) * 6
-                text_height = 11
-            
-            # Calculate position for bottom right corner
-            buffer_pixels = 50
-            x = self.settings.display_width - text_width - buffer_pixels
-            y = self.settings.display_height - text_height - buffer_pixels
-            
-            # Ensure position is not negative
-            x = max(0, x)
-            y = max(0, y)
+            if self._overlay_key != (self.settings.display_width, self.settings.display_height, image.mode):
+                self._prepare_overlay(image.mode)
             
-            # Draw a semi-transparent background rectangle for better readability
-            padding = 4
-            bg_x1 = x - padding
-            bg_y1 = y - padding
-            bg_x2 = x + text_width + padding
-            bg_y2 = y + text_height + padding
+            # Paste the prerendered box, then draw only the timestamp text in black
+            timestamp_text = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            image.paste(self._overlay_strip, self._overlay_strip_xy)
+            ImageDraw.Draw(image).text(self._overlay_text_xy, timestamp_text, fill='black', font=self._overlay_font)
             
-            # Draw white background with slight transparency effect (using a solid color for e-ink)
-            draw.rectangle([bg_x1, bg_y1, bg_x2, bg_y2], fill=(255, 255, 255), outline=(0, 0, 0), width=1)
-            
-            # Draw the timestamp text in black
-            draw.text((x, y), timestamp_text, fill=(0, 0, 0), font=font)
-            
-            return img_with_overlay
+            return image
             
         except Exception as e:
             self.logger.error(f"Failed to add timestamp overlay: {e}")
             # Return original image if overlay fails
             return image
 
-    async def _take_screenshot_async(self, output_path: Path) -> bool:
-        """Async method to take screenshot."""
+    async def _take_screenshot_async(self) -> Optional[bytes]:
+        """Async method to take screenshot; returns the encoded image bytes."""
         try:
-            start_time = time.time()
+            start_time = time.monotonic()
             
             if not self.page:
                 self.logger.error("Page not available for screenshot")
-                return False
+                return None
             
             # Wait for all components to be fully loaded before taking screenshot
             await self._wait_for_components_loaded()
             
             # Validate time before taking screenshot
+            html_content = None
             try:
                 html_content = await self.page.content()
                 validation_result = self.time_validator.validate_time_from_html(html_content)
@@ -434,13 +564,52 @@ class DashboardRenderer:
             except Exception as e:
                 self.logger.debug(f"Time validation failed: {e}")
             
-            await self.page.screenshot(path=str(output_path), full_page=True)
-            duration = time.time() - start_time
-            self.logger.info(f"Persistent screenshot taken in {duration:.1f}s")
-            return True
+            # Images and web fonts finish loading without changing the DOM, so only a capture
+            # of a settled page is keyed for reuse; an unsettled one is always retaken
+            page_settled = False
+            try:
+                page_settled = bool(await self.page.evaluate(PAGE_SETTLED_JS))
+            except Exception as e:
+                self.logger.debug(f"Page load state check failed: {e}")
+            
+            # Reuse the previous capture when the settled DOM has not changed since it was taken
+            page_hash = None
+            if html_content is not None and page_settled:
+                page_hash = hashlib.blake2b(html_content.encode('utf-8'), digest_size=8).digest()
+                if page_hash == self._last_page_hash and self._last_screenshot_bytes:
+                    self.logger.debug("Page content unchanged; reusing previous screenshot")
+                    return self._last_screenshot_bytes
+            
+            # Capture over CDP so Chromium can use its fast encoder settings. Clip to the
+            # viewport: a full-page capture would resize and re-lay out the page per shot.
+            params = {
+                'clip': {'x': 0, 'y': 0, 'width': self.settings.browser_width,
+                         'height': self.settings.browser_height, 'scale': 1},
+                'captureBeyondViewport': False,
+                'optimizeForSpeed': True,
+            }
+            # Lossless PNG for 1-bit output, where JPEG ringing around text would survive
+            # thresholding; grayscale modes get the much cheaper JPEG encode
+            if self.settings.epd_mode == 'bw':
+                params['format'] = 'png'
+            else:
+                params['format'] = 'jpeg'
+                params['quality'] = self.settings.screenshot_jpeg_quality
+            result = await self.cdp_session.send('Page.captureScreenshot', params)
+            screenshot_bytes = base64.b64decode(result['data'])
+            self._last_page_hash = page_hash
+            self._last_screenshot_bytes = screenshot_bytes
+            duration = time.monotonic() - start_time
+            self.logger.debug(f"Persistent screenshot taken in {duration:.1f}s")
+            return screenshot_bytes
         except Exception as e:
             self.logger.error(f"Failed to take async screenshot: {e}")
-            return False
+            return None
+    
+    def _invalidate_screenshot_cache(self):
+        """Forget the last capture so the next screenshot is taken fresh."""
+        self._last_page_hash = None
+        self._last_screenshot_bytes = None
     
     def refresh_persistent_browser(self) -> bool:
         """Refresh the persistent browser page."""
@@ -448,7 +617,7 @@ class DashboardRenderer:
             return False
         
         try:
-            return self.loop.run_until_complete(self._refresh_page_async())
+            return self._run_async(self._refresh_page_async())
         except Exception as e:
             self.logger.error(f"Failed to refresh persistent browser: {e}")
             return False
@@ -461,27 +630,62 @@ class DashboardRenderer:
                 return False
                 
             self.logger.info("Refreshing persistent browser page...")
-            await self.page.reload(wait_until="networkidle")
+            self._invalidate_screenshot_cache()
+            await self.page.reload(wait_until="domcontentloaded")
             
             # Wait for all components to be fully loaded after refresh
             await self._wait_for_components_loaded()
-            
-            # Optimize for e-ink display
-            await self._optimize_page_for_eink()
             return True
         except Exception as e:
             self.logger.error(f"Failed to refresh page: {e}")
             return False
     
+    def navigate_persistent_browser(self, url: str) -> bool:
+        """Load a different URL in the running persistent browser."""
+        if not self.is_persistent_browser_running or not self.loop:
+            return False
+        
+        try:
+            return self._run_async(self._navigate_page_async(url))
+        except Exception as e:
+            self.logger.error(f"Failed to navigate persistent browser: {e}")
+            return False
+    
+    async def _navigate_page_async(self, url: str) -> bool:
+        """Async method to load a new URL in the existing page."""
+        try:
+            if not self.page:
+                self.logger.error("Page not available for navigation")
+                return False
+            
+            self.logger.info(f"Navigating persistent browser to: {url}")
+            self._invalidate_screenshot_cache()
+            await self.page.goto(url, wait_until="domcontentloaded")
+            self.current_url = url
+            
+            # Wait for all components to be fully loaded after navigation
+            await self._wait_for_components_loaded()
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to navigate page: {e}")
+            return False
+    
     def cleanup_persistent_browser(self):
         """Clean up persistent browser resources."""
         if self.loop:
             try:
-                self.loop.run_until_complete(self._cleanup_persistent_browser())
-                self.loop.close()
-                self.loop = None
+                self._run_async(self._cleanup_persistent_browser())
             except Exception as e:
                 self.logger.error(f"Error during persistent browser cleanup: {e}")
+            finally:
+                # Stop the loop thread before closing the loop
+                self.loop.call_soon_threadsafe(self.loop.stop)
+                if self.loop_thread:
+                    self.loop_thread.join(timeout=5)
+                    self.loop_thread = None
+                if not self.loop.is_running():
+                    self.loop.close()
+                self.loop = None
     
     async def _cleanup_persistent_browser(self):
         """Async method to clean up browser resources."""
@@ -497,7 +701,9 @@ class DashboardRenderer:
                 self.playwright = None
                 
             self.page = None
+            self.cdp_session = None
             self.current_url = None
+            self._invalidate_screenshot_cache()
             
             self.logger.info("Persistent browser cleaned up")
             
@@ -29,7 +29,7 @@ class ImageProcessor:
                 self.logger.info(f"Resizing image from {image.size} to {self.settings.display_width}x{self.settings.display_height}")
                 image = image.resize(
                     (self.settings.display_width, self.settings.display_height),
-                    Image.Resampling.LANCZOS
+                    Image.Resampling.BILINEAR
                 )
             
             # Convert to grayscale
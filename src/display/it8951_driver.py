@@ -3,6 +3,8 @@ IT8951 E-ink display driver using GregDMeyer/IT8951 library.
 Provides direct control over IT8951 controller for enhanced partial refresh capabilities.
 """
 
+import functools
+import hashlib
 import logging
 import time
 import os
@@ -18,6 +20,26 @@ except ImportError:
     logging.warning("IT8951 library not available - running in simulation mode")
 
 
+@functools.lru_cache(maxsize=None)
+def _load_font(size: int, bold: bool = False) -> ImageFont.ImageFont:
+    """Load a system font with fallback to default, parsing each (size, bold) only once."""
+    font_paths = [
+        '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf' if bold else '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
+        '/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf' if bold else '/usr/share/fonts/truetype/liberation/LiberationSans.ttf',
+        '/System/Library/Fonts/Arial.ttf',  # macOS
+        'C:/Windows/Fonts/arial.ttf'  # Windows
+    ]
+    
+    for font_path in font_paths:
+        try:
+            return ImageFont.truetype(font_path, size)
+        except (OSError, IOError):
+            continue
+    
+    # Fall back to default font
+    return ImageFont.load_default()
+
+
 class IT8951Driver:
     """Driver for IT8951-based e-Paper displays with enhanced partial refresh control."""
     
@@ -30,6 +52,7 @@ class IT8951Driver:
         self.partial_refresh_count = 0
         self.last_update_time = 0
         self.last_image = None
+        self.last_image_hash = None  # Digest of what update() last put on the panel
         
         # Display object
         self.display = None
@@ -78,6 +101,9 @@ class IT8951Driver:
                 self.logger.info("Updating settings to match hardware display dimensions")
                 self.settings.display_width = self.display.width
                 self.settings.display_height = self.display.height
+                # Keep the browser viewport (and screenshot clip) matched to the panel
+                self.settings.browser_width = self.display.width
+                self.settings.browser_height = self.display.height
             
             self.hardware_initialized = True
             self.logger.info("IT8951 display initialized successfully")
@@ -129,6 +155,12 @@ class IT8951Driver:
             # Process image for display
             processed_image = self._process_image(image)
             
+            # Skip the SPI transfer and waveform when the panel already shows this image
+            image_hash = hashlib.blake2b(processed_image.tobytes(), digest_size=16).digest()
+            if not need_full_refresh and region is None and image_hash == self.last_image_hash:
+                self.logger.info("Display content unchanged, skipping update")
+                return True
+            
             # Perform the update
             start_time = time.time()
             
@@ -165,6 +197,8 @@ class IT8951Driver:
             duration = time.time() - start_time
             self.last_update_time = time.time()
             self.last_image = processed_image.copy()
+            # A region update leaves the rest of the panel as it was; only a whole-frame write is known
+            self.last_image_hash = image_hash if region is None else None
             
             self.logger.info(f"Display update completed successfully in {duration:.2f}s")
             return True
@@ -189,18 +223,28 @@ class IT8951Driver:
     def _process_image(self, image: Image.Image) -> Image.Image:
         """Process image for optimal display on IT8951."""
         try:
-            # Ensure correct size
-            if image.size != (self.settings.display_width, self.settings.display_height):
-                self.logger.debug(f"Resizing image from {image.size} to {self.settings.display_width}x{self.settings.display_height}")
-                image = image.resize(
-                    (self.settings.display_width, self.settings.display_height),
-                    Image.Resampling.LANCZOS
-                )
-            
-            # Convert to grayscale if needed
+            # Convert to grayscale first so any resize works on one channel instead of three
             if image.mode != 'L':
                 image = image.convert('L')
             
+            # Frames captured at the panel resolution (the normal case) need no resampling
+            target = (self.settings.display_width, self.settings.display_height)
+            if image.size == target:
+                return image
+            
+            # Scale to fit without distorting the aspect ratio; bilinear is plenty ahead of
+            # 16-level/1-bit quantization, and reducing_gap box-reduces large downscales first
+            self.logger.debug(f"Resizing image from {image.size} to fit {target[0]}x{target[1]}")
+            scale = min(target[0] / image.width, target[1] / image.height)
+            fitted_size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+            image = image.resize(fitted_size, Image.Resampling.BILINEAR, reducing_gap=2.0)
+            
+            # Letterbox any leftover margin in white
+            if image.size != target:
+                canvas = Image.new('L', target, 255)
+                canvas.paste(image, ((target[0] - image.width) // 2, (target[1] - image.height) // 2))
+                image = canvas
+            
             return image
             
         except Exception as e:
@@ -252,16 +296,16 @@ class IT8951Driver:
                 self.partial_refresh_count = 0
                 return True
             
-            # Create white image and display it
-            white_image = Image.new('L', (self.settings.display_width, self.settings.display_height), 255)
-            
             # Hardware is initialized, so display must not be None
             assert self.display is not None, "Display should not be None when hardware is initialized"
             
+            # Fill the frame buffer with white in place rather than allocating a white image
+            self.display.frame_buf.paste(255, (0, 0, self.settings.display_width, self.settings.display_height))
+            
             # Use full refresh for clearing with INIT mode
-            self.display.frame_buf.paste(white_image, (0, 0))
             self.display.draw_full(constants.DisplayModes.INIT)
             self.partial_refresh_count = 0  # Reset counter after clear
+            self.last_image_hash = None  # Panel is blank, not the last update() frame
             
             self.logger.info("Display cleared successfully")
             return True
@@ -316,14 +360,8 @@ class IT8951Driver:
                                  (255, 255, 255))
             
             # Add some test content
-            from PIL import ImageDraw, ImageFont
             draw = ImageDraw.Draw(test_image)
-            
-            # Try to load a font, fall back to default
-            try:
-                font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 60)
-            except (OSError, IOError):
-                font = ImageFont.load_default()
+            font = self._load_font(60)
             
             # Draw test text
             draw.text((40, 40), "Pi Home Dashboard", fill='black', font=font)
@@ -376,21 +414,7 @@ class IT8951Driver:
     
     def _load_font(self, size: int, bold: bool = False) -> ImageFont.ImageFont:
         """Load a system font with fallback to default."""
-        font_paths = [
-            '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf' if bold else '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
-            '/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf' if bold else '/usr/share/fonts/truetype/liberation/LiberationSans.ttf',
-            '/System/Library/Fonts/Arial.ttf',  # macOS
-            'C:/Windows/Fonts/arial.ttf'  # Windows
-        ]
-        
-        for font_path in font_paths:
-            try:
-                return ImageFont.truetype(font_path, size)
-            except (OSError, IOError):
-                continue
-        
-        # Fall back to default font
-        return ImageFont.load_default()
+        return _load_font(size, bold)
     
     def create_text_image(self, text: str, font_size: int = 24, center: bool = True, 
                          add_timestamp: bool = True) -> Image.Image:
@@ -602,6 +626,7 @@ class IT8951Driver:
             self.display.draw_partial(mode)
             
             self.partial_refresh_count += 1
+            self.last_image_hash = None
             self.logger.info(f"Direct partial refresh completed (mode: {display_mode or 'GLR16'})")
             return True
             
@@ -635,6 +660,7 @@ class IT8951Driver:
             self.display.draw_full(mode)
             
             self.partial_refresh_count = 0
+            self.last_image_hash = None
             self.logger.info(f"Direct full refresh completed (mode: {display_mode or 'GC16'})")
             return True
             
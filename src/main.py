@@ -7,10 +7,15 @@ Renders calendar, weather, and to-do information to a Waveshare 10.3" e-Paper di
 """
 
 import argparse
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
+import shutil
+import socket
 import sys
 import time
-import psutil
 from pathlib import Path
 from datetime import datetime, timedelta
 
@@ -23,6 +28,30 @@ from dashboard.mock_renderer import MockDashboardRenderer
 from display.it8951_driver import IT8951Driver
 from monitoring.prometheus_collector import PrometheusCollector, PrometheusTimer
 
+PAGE_SIZE = os.sysconf('SC_PAGE_SIZE')
+
+# Browser memory watchdog: scans in a row over the limit before a restart, and the
+# minimum gap after a restart, doubled on each repeat restart up to the maximum
+MEMORY_OVER_LIMIT_SCANS = 3
+MEMORY_RESTART_BACKOFF_S = 15 * 60
+MEMORY_RESTART_BACKOFF_MAX_S = 6 * 60 * 60
+
+
+def _read_pss_kb(pid):
+    """Return the proportional set size of a process in kB, or None if unavailable.
+    
+    PSS splits shared pages between the processes mapping them, so summing it over
+    Chromium's processes does not count shared libraries and memory once per process.
+    """
+    try:
+        with open(f'/proc/{pid}/smaps_rollup', 'rb') as f:
+            for line in f:
+                if line.startswith(b'Pss:'):
+                    return int(line.split()[1])
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
 
 class PiHomeDashboard:
     """Main dashboard application class."""
@@ -36,6 +65,18 @@ class PiHomeDashboard:
         self._setup_logging()
         self.logger = logging.getLogger(__name__)
         
+        # Mock renderer for test runs and the mock dashboard type; DAKboard is never loaded then
+        use_mock_renderer = self.settings.dashboard_type == 'mock' or test_mode
+        
+        # Cheap check on every start; only build the full report when something is wrong.
+        # Logged rather than raised so display tests still run with an incomplete config,
+        # and only as a warning when the mock renderer makes e.g. a missing DAKboard URL moot.
+        if not self.settings.is_valid():
+            try:
+                self.settings.validate()
+            except ValueError as e:
+                self.logger.log(logging.WARNING if use_mock_renderer else logging.ERROR, str(e))
+        
         # Initialize metrics collection
         self.metrics = PrometheusCollector(port=self.settings.prometheus_port)
         if self.settings.prometheus_enabled:
@@ -43,7 +84,7 @@ class PiHomeDashboard:
         self.metrics.set_update_interval(self.settings.update_interval)
         
         # Initialize renderer (mock or real based on settings)
-        if self.settings.dashboard_type == 'mock' or test_mode:
+        if use_mock_renderer:
             self.renderer = MockDashboardRenderer(self.settings)
         else:
             self.renderer = DashboardRenderer(self.settings, self.metrics)
@@ -57,6 +98,19 @@ class PiHomeDashboard:
         self.browser_refresh_count = 0
         self.max_renders_before_refresh = 1440  # Refresh browser every day (1440 minutes)
         
+        # Cached process scan: (timestamp, browser_processes, browser_memory_mb, browser_running)
+        self._proc_scan_cache = None
+        
+        # Memory watchdog state: consecutive over-limit scans and restart backoff
+        self._memory_over_limit_scans = 0
+        self._memory_last_scan_at = None
+        self._memory_restart_at = None
+        self._memory_restart_backoff = MEMORY_RESTART_BACKOFF_S
+        
+        # Cached network reachability: (expiry monotonic time, connected)
+        self._net_cache = None
+        self.network_check_ttl = 30  # seconds
+        
         # Log initialization info
         if test_mode:
             self.logger.info("Dashboard initialized in test mode")
@@ -85,10 +139,18 @@ class PiHomeDashboard:
                 # If all else fails, just use console logging
                 pass
         
+        # Write log records from a background thread so slow SD-card I/O stays
+        # off the render path; records are formatted before being queued
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(log_queue, *handlers)
+        listener.start()
+        atexit.register(listener.stop)
+        
         logging.basicConfig(
             level=level,
             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=handlers
+            handlers=[logging.handlers.QueueHandler(log_queue)],
+            force=True  # Replace the default handler an import-time warning may have installed
         )
     
     def _initialize_persistent_browser_with_retry(self, max_retries=3, retry_delay=5):
@@ -137,9 +199,13 @@ class PiHomeDashboard:
             image.save(filepath, "PNG")
             self.logger.info(f"Screenshot saved: {filepath}")
             
-            # Also save as "latest.png" for easy access
+            # Also expose as "latest.png" for easy access. Copy the file just
+            # written instead of encoding the PNG a second time, and swap it in
+            # atomically so readers never see a partially written file.
             latest_path = screenshots_dir / "latest.png"
-            image.save(latest_path, "PNG")
+            temp_latest_path = screenshots_dir / ".latest.png.tmp"
+            shutil.copyfile(filepath, temp_latest_path)
+            os.replace(temp_latest_path, latest_path)
             
             # Manage screenshot limit (keep only the 10 most recent)
             self._cleanup_old_screenshots(screenshots_dir, max_screenshots=10)
@@ -216,30 +282,62 @@ class PiHomeDashboard:
             # Fall back to console message if display fails
             print(f"🚀 Initializing {mode_display} at {friendly_time}...")
     
-    def _collect_browser_metrics(self):
-        """Collect and send browser metrics to Prometheus."""
-        try:
-            browser_processes = 0
-            browser_memory_mb = 0.0
-            
-            # Look for headless_shell processes (Playwright browser processes)
-            for proc in psutil.process_iter(['pid', 'name', 'memory_info']):
+    def _scan_processes(self):
+        """Walk /proc once per update and cache browser process stats.
+        
+        All process-derived metrics read from ``self._proc_scan_cache`` so each
+        update costs a single /proc scan regardless of how many collectors use it.
+        Reads /proc/<pid>/stat directly rather than going through psutil, which
+        opens several files and builds a Process per PID. A single stat read
+        yields the command name and the resident set size; browser processes
+        are then measured by PSS, falling back to RSS where smaps_rollup is missing.
+        """
+        browser_processes = 0
+        browser_kb = 0
+        
+        with os.scandir('/proc') as entries:
+            for entry in entries:
+                pid = entry.name
+                if not pid.isdigit():
+                    continue
+                
                 try:
-                    proc_info = proc.info
-                    proc_name = proc_info['name'].lower()
+                    with open(f'/proc/{pid}/stat', 'rb') as f:
+                        stat = f.read()
+                    
+                    # comm is wrapped in parentheses and may itself contain spaces
+                    rparen = stat.rindex(b')')
                     
                     # Check if this is a headless_shell process (Playwright browser)
-                    if 'headless_shell' in proc_name:
-                        browser_processes += 1
-                        # Convert bytes to MB
-                        memory_bytes = proc_info['memory_info'].rss
-                        browser_memory_mb += memory_bytes / (1024 * 1024)
-                        
-                        self.logger.debug(f"Found browser process: {proc_info['name']} (PID: {proc_info['pid']}, Memory: {memory_bytes / (1024 * 1024):.1f}MB)")
+                    if b'headless_shell' not in stat[stat.index(b'(') + 1:rparen]:
+                        continue
+                    
+                    # Field 24 (rss, in pages) is the 22nd field after comm
+                    rss_pages = int(stat[rparen + 2:].split()[21])
                         
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                except (OSError, ValueError, IndexError):
                     # Process disappeared or access denied, skip it
                     continue
+                
+                process_kb = _read_pss_kb(pid)
+                if process_kb is None:
+                    process_kb = rss_pages * PAGE_SIZE // 1024
+                
+                browser_processes += 1
+                browser_kb += process_kb
+                
+                self.logger.debug(f"Found browser process: headless_shell (PID: {pid}, Memory: {process_kb / 1024:.1f}MB)")
+        
+        # Convert kB to MB once for the whole scan
+        self._proc_scan_cache = (time.monotonic(), browser_processes, browser_kb / 1024, browser_processes > 0)
+        return self._proc_scan_cache
+    
+    def _collect_browser_metrics(self):
+        """Collect and send browser metrics to Prometheus."""
+        try:
+            if self._proc_scan_cache is None:
+                self._scan_processes()
+            _, browser_processes, browser_memory_mb, _ = self._proc_scan_cache
             
             # Send browser metrics
             self.metrics.send_browser_metrics(
@@ -252,6 +350,94 @@ class PiHomeDashboard:
         except Exception as e:
             self.logger.warning(f"Failed to collect browser metrics: {e}")
     
+    def _restart_browser_if_over_memory(self):
+        """Restart the persistent browser once its memory stays over the limit.
+        
+        A restart needs MEMORY_OVER_LIMIT_SCANS consecutive scans over the limit and
+        is held off for a backoff period after the previous one, so a steady state
+        that simply sits above the limit cannot cold-restart Chromium every update.
+        
+        Returns:
+            bool: False only if a restart was needed and failed
+        """
+        limit_mb = self.settings.max_browser_memory_mb
+        if not limit_mb or self._proc_scan_cache is None:
+            return True
+        
+        scanned_at, _, browser_memory_mb, _ = self._proc_scan_cache
+        if scanned_at == self._memory_last_scan_at:
+            return True  # Already judged this scan
+        self._memory_last_scan_at = scanned_at
+        
+        if browser_memory_mb <= limit_mb:
+            self._memory_over_limit_scans = 0
+            return True
+        
+        self._memory_over_limit_scans += 1
+        if self._memory_over_limit_scans < MEMORY_OVER_LIMIT_SCANS:
+            self.logger.info(f"Browser memory {browser_memory_mb:.1f}MB over {limit_mb}MB limit "
+                             f"({self._memory_over_limit_scans}/{MEMORY_OVER_LIMIT_SCANS} scans)")
+            return True
+        
+        now = time.monotonic()
+        if self._memory_restart_at is not None:
+            since_restart = now - self._memory_restart_at
+            if since_restart < self._memory_restart_backoff:
+                self.logger.warning(f"Browser memory {browser_memory_mb:.1f}MB exceeds {limit_mb}MB limit, "
+                                    f"but last restart was {since_restart:.0f}s ago; holding off")
+                return True
+            if since_restart > MEMORY_RESTART_BACKOFF_MAX_S:
+                self._memory_restart_backoff = MEMORY_RESTART_BACKOFF_S
+            else:
+                # Restarting again soon after the last one: wait longer next time
+                self._memory_restart_backoff = min(self._memory_restart_backoff * 2, MEMORY_RESTART_BACKOFF_MAX_S)
+        
+        self.logger.warning(f"Browser memory {browser_memory_mb:.1f}MB exceeds {limit_mb}MB limit, restarting browser...")
+        self._memory_restart_at = now
+        self._memory_over_limit_scans = 0
+        # Drop the stale scan so the restart is not judged on pre-restart memory
+        self._proc_scan_cache = None
+        self.renderer.cleanup_persistent_browser()
+        self.persistent_browser_enabled = False
+        
+        if not self._initialize_persistent_browser_with_retry():
+            return False
+        self.persistent_browser_enabled = True
+        self.browser_refresh_count = 0
+        return True
+    
+    def _check_network_connected(self):
+        """Check network reachability in-process, caching the result for network_check_ttl seconds."""
+        now = time.monotonic()
+        if self._net_cache is not None and now < self._net_cache[0]:
+            return self._net_cache[1]
+        
+        try:
+            # connect() on a UDP socket only resolves a route - no packets are sent
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+                s.settimeout(0.5)
+                s.connect(('8.8.8.8', 53))
+            connected = True
+        except OSError:
+            connected = False
+        
+        self._net_cache = (now + self.network_check_ttl, connected)
+        return connected
+    
+    def _collect_status_metrics(self):
+        """Collect and send service status metrics to Prometheus."""
+        try:
+            # Browser status comes from the cached process scan; unknown until the first one
+            browser_running = self._proc_scan_cache[3] if self._proc_scan_cache is not None else None
+            self.metrics.send_service_status(
+                service_running=True,
+                display_connected=self.display.is_available,
+                network_connected=self._check_network_connected(),
+                browser_running=browser_running
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to collect status metrics: {e}")
+    
     def _calculate_next_update_time(self, current_time):
         """Calculate the next update time, aligning to minute boundaries for round minute intervals.
         For DAKboard mode, targets 5 seconds after the top of the minute to account for DAKboard loading delay.
@@ -357,6 +543,12 @@ class PiHomeDashboard:
                 if (self.settings.dashboard_type == "dakboard" and 
                     self.persistent_browser_enabled):
                     
+                    # Restart the browser before it grows into an OOM
+                    if not self._restart_browser_if_over_memory():
+                        self.logger.error("Failed to restart browser after exceeding memory limit")
+                        self.metrics.record_update_failure()
+                        return False
+                    
                     # Check if we need to refresh the browser page
                     if self.browser_refresh_count >= self.max_renders_before_refresh:
                         self.logger.info("Refreshing persistent browser page...")
@@ -412,8 +604,13 @@ class PiHomeDashboard:
                     self.logger.info("Display update completed successfully")
                     self.metrics.record_update_success()
                     
-                    # Collect browser metrics after successful update
+                    # Scan processes once, then collect browser metrics from the cache
+                    try:
+                        self._scan_processes()
+                    except Exception as e:
+                        self.logger.warning(f"Failed to scan processes: {e}")
                     self._collect_browser_metrics()
+                    self._collect_status_metrics()
                     
                     # Log performance summary periodically (simplified for Prometheus)
                     summary = self.metrics.get_metrics_summary()
@@ -556,8 +753,8 @@ def main():
     
     args = parser.parse_args()
     
-    # Create dashboard instance
-    dashboard = PiHomeDashboard()
+    # Create dashboard instance; the display test never renders the dashboard
+    dashboard = PiHomeDashboard(test_mode=args.test)
     
     # Override debug setting if specified
     if args.debug:
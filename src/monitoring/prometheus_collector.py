@@ -258,13 +258,17 @@ class PrometheusCollector:
     
     def send_service_status(self, service_running: bool = True, 
                           display_connected: bool = True,
-                          network_connected: bool = True):
-        """Send service status metrics."""
+                          network_connected: bool = True,
+                          browser_running: Optional[bool] = None):
+        """Send service status metrics; browser status is only set when known."""
         self.service_status.labels(component='service').set(1 if service_running else 0)
         self.service_status.labels(component='display').set(1 if display_connected else 0)
         self.service_status.labels(component='network').set(1 if network_connected else 0)
+        if browser_running is not None:
+            self.service_status.labels(component='browser').set(1 if browser_running else 0)
         logger.debug(f"Updated service status - service: {service_running}, "
-                    f"display: {display_connected}, network: {network_connected}")
+                    f"display: {display_connected}, network: {network_connected}, "
+                    f"browser: {browser_running}")
     
     def get_refresh_ratio(self) -> float:
         """Get partial to full refresh ratio (for compatibility with existing code)."""
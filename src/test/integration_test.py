@@ -23,6 +23,20 @@ from dashboard.renderer import DashboardRenderer
 from display.it8951_driver import IT8951Driver
 
 
+def _summarize(metrics: List[Dict], key: str) -> Tuple[float, float, float]:
+    """Return (avg, max, min) of metrics[i][key] in a single pass."""
+    total = 0.0
+    hi = lo = metrics[0][key]
+    for m in metrics:
+        value = m[key]
+        total += value
+        if value > hi:
+            hi = value
+        elif value < lo:
+            lo = value
+    return total / len(metrics), hi, lo
+
+
 class IntegrationTestRunner:
     """Main integration test runner class."""
     
@@ -239,26 +253,27 @@ class IntegrationTestRunner:
         total_duration = end_time - (self.start_time or 0)
         
         # Calculate statistics
+        total_cycles = len(self.test_results)
         successful_cycles = sum(1 for r in self.test_results if r['success'])
-        failed_cycles = len(self.test_results) - successful_cycles
-        success_rate = (successful_cycles / len(self.test_results)) * 100 if self.test_results else 0
+        failed_cycles = total_cycles - successful_cycles
+        success_rate = (successful_cycles * 100 / total_cycles) if total_cycles else 0
         
         # Performance statistics
         if self.performance_metrics:
-            render_times = [m['render_time'] for m in self.performance_metrics]
-            display_times = [m['display_time'] for m in self.performance_metrics]
-            total_times = [m['total_time'] for m in self.performance_metrics]
+            avg_render, max_render, min_render = _summarize(self.performance_metrics, 'render_time')
+            avg_display, max_display, min_display = _summarize(self.performance_metrics, 'display_time')
+            avg_total, max_total, min_total = _summarize(self.performance_metrics, 'total_time')
             
             perf_stats = {
-                'avg_render_time': sum(render_times) / len(render_times),
-                'max_render_time': max(render_times),
-                'min_render_time': min(render_times),
-                'avg_display_time': sum(display_times) / len(display_times),
-                'max_display_time': max(display_times),
-                'min_display_time': min(display_times),
-                'avg_total_time': sum(total_times) / len(total_times),
-                'max_total_time': max(total_times),
-                'min_total_time': min(total_times)
+                'avg_render_time': avg_render,
+                'max_render_time': max_render,
+                'min_render_time': min_render,
+                'avg_display_time': avg_display,
+                'max_display_time': max_display,
+                'min_display_time': min_display,
+                'avg_total_time': avg_total,
+                'max_total_time': max_total,
+                'min_total_time': min_total
             }
         else:
             perf_stats = {}
@@ -269,7 +284,7 @@ class IntegrationTestRunner:
             'test_config': {
                 'duration': self.test_duration,
                 'interval': self.test_interval,
-                'total_cycles': len(self.test_results)
+                'total_cycles': total_cycles
             },
             'results': {
                 'successful_cycles': successful_cycles,
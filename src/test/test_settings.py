@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests for Settings.load_from_file: .env parsing, override precedence and TOML flattening.
+"""
+
+import os
+import sys
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+# Add src directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import settings as settings_module
+from config.settings import Settings
+
+
+# Every variable the tests below read from a config file; cleared so defaults apply
+ENV_KEYS = (
+    "DAKBOARD_URL", "DASHBOARD_TYPE", "UPDATE_INTERVAL",
+    "DISPLAY_WIDTH", "DISPLAY_HEIGHT", "EMPTY_VALUE", "QUOTED",
+)
+
+
+@pytest.fixture
+def clean_env(monkeypatch):
+    """Clear the tested variables and restore the whole environment afterwards.
+    
+    load_from_file writes straight to os.environ, so the snapshot taken by
+    mock.patch.dict is what keeps its values from leaking into later tests.
+    """
+    with mock.patch.dict(os.environ):
+        for key in ENV_KEYS:
+            os.environ.pop(key, None)
+        yield monkeypatch
+
+
+def test_env_file_parsing(tmp_path, clean_env):
+    """Comments, CRLF endings, quotes, empty values and export lines."""
+    env_file = tmp_path / "test.env"
+    env_file.write_bytes(
+        b"# Dashboard settings\r\n"
+        b"  # indented comment = ignored\r\n"
+        b"DAKBOARD_URL = \"https://dakboard.com/screen/abc\"\r\n"
+        b"DASHBOARD_TYPE='dakboard'\r\n"
+        b"export UPDATE_INTERVAL=120\r\n"
+        b"EMPTY_VALUE=\r\n"
+        b"QUOTED=\"\"\r\n"
+        b"not a setting\r\n"
+        b"DISPLAY_WIDTH=1872   \r\n"
+    )
+
+    settings = Settings()
+    settings.load_from_file(env_file)
+
+    assert os.environ["DAKBOARD_URL"] == "https://dakboard.com/screen/abc"
+    assert os.environ["DASHBOARD_TYPE"] == "dakboard"
+    assert os.environ["UPDATE_INTERVAL"] == "120"
+    assert os.environ["EMPTY_VALUE"] == ""
+    assert os.environ["QUOTED"] == ""
+    assert os.environ["DISPLAY_WIDTH"] == "1872"
+    assert "export UPDATE_INTERVAL" not in os.environ
+
+    assert settings.dakboard_url == "https://dakboard.com/screen/abc"
+    assert settings.update_interval == 120
+    assert settings.display_width == 1872
+    assert settings.browser_width == 1872
+
+
+def test_override_false_keeps_existing_env(tmp_path, clean_env):
+    """With override=False, values already in the environment win over the file."""
+    clean_env.setenv("UPDATE_INTERVAL", "300")
+    env_file = tmp_path / "test.env"
+    env_file.write_text("UPDATE_INTERVAL=120\nDISPLAY_HEIGHT=1404\n", encoding="utf-8")
+
+    settings = Settings()
+    settings.load_from_file(env_file, override=False)
+
+    assert settings.update_interval == 300
+    assert settings.display_height == 1404
+
+    settings.load_from_file(env_file)
+    assert settings.update_interval == 120
+
+
+@pytest.mark.skipif(settings_module.tomllib is None, reason="TOML support needs tomllib or tomli")
+def test_toml_nested_table_is_flattened(tmp_path, clean_env):
+    """A [display] table's width key becomes DISPLAY_WIDTH."""
+    config_file = tmp_path / "config.toml"
+    config_file.write_text("[display]\nwidth = 1600\nheight = 1200\n", encoding="utf-8")
+
+    settings = Settings()
+    settings.load_from_file(config_file)
+
+    assert os.environ["DISPLAY_WIDTH"] == "1600"
+    assert settings.display_width == 1600
+    assert settings.display_height == 1200
+    assert settings.browser_height == 1200